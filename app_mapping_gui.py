@@ -6,6 +6,7 @@ import os
 import customtkinter as ctk
 from datetime import datetime
 import json
+from queue import Empty
 
 
 def setup_logging():
@@ -33,25 +34,26 @@ def setup_logging():
         return False
 
 
-def run_mapping_gui_process(data, queue):
-    """Run GUI in separate process"""
+def run_mapping_gui_process(command_queue, conn):
+    """Run GUI in a persistent process, showing the window on request"""
     try:
         setup_logging()
-        logging.info(f"Starting GUI process with data: {data}")
+        logging.info("Starting GUI process")
 
         def send_message(msg_type, msg_data=None):
             """Send message to main process with validation"""
             try:
-                queue.put_nowait((msg_type, msg_data))
+                conn.send((msg_type, msg_data))
                 logging.debug(f"Sent message: {msg_type} with data: {msg_data}")
                 return True
             except Exception as e:
                 logging.error(f"Failed to send message {msg_type}: {e}")
                 return False
 
-        # Set theme and initialize GUI
+        # Set theme and initialize GUI once for the life of the process
         ctk.set_appearance_mode("dark")
         root = ctk.CTk()
+        root.withdraw()
 
         # Load and set window icon
         try:
@@ -92,15 +94,43 @@ def run_mapping_gui_process(data, queue):
         except Exception as e:
             logging.warning(f"Failed to set window icon: {e}")
 
-        gui = AppMappingGUI(root, data, send_message)
         root.title("Audio Mapper")
         root.geometry("500x600")
 
+        state = {"gui": None, "poll_id": None, "quit": False}
+
+        def show(data):
+            """Rebuild the mapping view from fresh data and bring it to front"""
+            logging.info(f"Showing GUI with data: {data}")
+            if state["gui"] is not None:
+                state["gui"].main_container.destroy()
+            state["gui"] = AppMappingGUI(root, data, send_message)
+
+            # Center window on screen
+            root.update_idletasks()
+            width = root.winfo_width()
+            height = root.winfo_height()
+            x = (root.winfo_screenwidth() // 2) - (width // 2)
+            y = (root.winfo_screenheight() // 2) - (height // 2)
+            root.geometry(f"+{x}+{y}")
+
+            root.deiconify()
+            root.lift()
+            root.focus_force()
+
+        def stop_window_loop():
+            """Hide the window and return control to the command loop"""
+            if state["poll_id"]:
+                root.after_cancel(state["poll_id"])
+                state["poll_id"] = None
+            root.withdraw()
+            root.quit()
+
         # Handle window closing with state save
         def on_closing():
             try:
                 logging.info("Saving final state before closing")
-                success = gui.save_state()
+                success = state["gui"].save_state()
                 if success:
                     logging.info("Final state saved successfully")
                     send_message("force_save", None)  # Force config save
@@ -109,20 +139,38 @@ def run_mapping_gui_process(data, queue):
             except Exception as e:
                 logging.error(f"Error during window closing: {e}")
             finally:
-                root.destroy()
+                stop_window_loop()
 
         root.protocol("WM_DELETE_WINDOW", on_closing)
 
-        # Center window on screen
-        root.update_idletasks()
-        width = root.winfo_width()
-        height = root.winfo_height()
-        x = (root.winfo_screenwidth() // 2) - (width // 2)
-        y = (root.winfo_screenheight() // 2) - (height // 2)
-        root.geometry(f"+{x}+{y}")
-
-        # Run mainloop
-        root.mainloop()
+        def poll_commands():
+            """Handle commands that arrive while the window is open"""
+            state["poll_id"] = None
+            try:
+                while True:
+                    msg_type, msg_data = command_queue.get_nowait()
+                    if msg_type == "show":
+                        show(msg_data)
+                    elif msg_type == "quit":
+                        state["quit"] = True
+                        stop_window_loop()
+                        return
+            except Empty:
+                pass
+            state["poll_id"] = root.after(100, poll_commands)
+
+        # Block while hidden; run the Tk loop only while the window is shown
+        while not state["quit"]:
+            msg_type, msg_data = command_queue.get()
+            if msg_type == "quit":
+                break
+            if msg_type == "show":
+                show(msg_data)
+                state["poll_id"] = root.after(100, poll_commands)
+                root.mainloop()
+
+        root.destroy()
+        logging.info("GUI process exiting")
 
     except Exception as e:
         logging.error(f"Error in GUI process: {e}", exc_info=True)
@@ -5,7 +5,7 @@ import keyboard
 import pystray
 from PIL import Image
 import os
-from threading import Thread, Timer
+from threading import Thread, Timer, Lock, RLock, local
 import logging
 from datetime import datetime
 import traceback
@@ -13,20 +13,27 @@ import sys
 import subprocess
 from overlay_notification import OverlayNotification
 from enum import Enum
+from typing import NamedTuple
 import ctypes
 import win32api
 import win32con
+import win32event
+import pywintypes
 import win32security
 import winreg
 import win32com.client
 import win32process
 from app_mapping_gui import AppMappingGUI, run_mapping_gui_process
 import queue
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
 from pythoncom import CoInitialize, CoUninitialize
 import tkinter as tk
 from update_checker import UpdateChecker
 import asyncio
-from multiprocessing import Process, Queue, freeze_support
+from multiprocessing import Pipe, Process, Queue, freeze_support
+from multiprocessing.connection import wait as wait_connections
 import os.path
 
 
@@ -35,6 +42,53 @@ class DeviceType(Enum):
     HEADPHONE = "Headphones"
 
 
+class AppMapping(NamedTuple):
+    """Audio device mapping for a single application"""
+
+    type: str
+    device_id: str
+    disabled: bool = False
+
+
+def _is_valid_mapping_entry(config):
+    """Check one app mapping entry received from the mapping GUI"""
+    return (
+        isinstance(config, dict)
+        and isinstance(config.get("type"), str)
+        and isinstance(config.get("device_id"), (str, int))
+        and isinstance(config.get("disabled", False), bool)
+    )
+
+
+def _char_mask(text):
+    """Return a 64-bit mask of the characters present in text"""
+    mask = 0
+    for ch in set(text):
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+def _menu_checked(item):
+    """Shared checked-state callback for active menu entries"""
+    return True
+
+
+def _menu_unchecked(item):
+    """Shared checked-state callback for inactive menu entries"""
+    return False
+
+
+# Tracks which threads have already initialized COM
+_com_state = local()
+
+
+def _ensure_com_initialized():
+    """Initialize COM once for the calling thread"""
+    if not getattr(_com_state, "initialized", False):
+        CoInitialize()
+        _com_state.initialized = True
+
+
 class AudioDeviceListener:
     """Monitors audio device changes"""
 
@@ -141,6 +195,99 @@ class ProcessMonitor:
             self._timer.start()
 
 
+class ConfigFileWatcher:
+    """Signals when the config file is written"""
+
+    FILE_LIST_DIRECTORY = 0x0001
+
+    def __init__(self, config_file, callback):
+        self._config_file = config_file
+        self._callback = callback
+        self._running = True
+        self._thread = None
+        # Manual-reset event that wakes the watch thread on stop
+        self._stop_event = win32event.CreateEvent(None, True, False, None)
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        self._thread = Thread(target=self._watch, daemon=True, name="ConfigWatcher")
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        # The watch thread cancels its pending read and closes the handle
+        win32event.SetEvent(self._stop_event)
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+
+    def _watch(self):
+        try:
+            import win32file
+
+            directory = os.path.dirname(os.path.abspath(self._config_file))
+            handle = win32file.CreateFile(
+                directory,
+                self.FILE_LIST_DIRECTORY,
+                win32con.FILE_SHARE_READ
+                | win32con.FILE_SHARE_WRITE
+                | win32con.FILE_SHARE_DELETE,
+                None,
+                win32con.OPEN_EXISTING,
+                win32con.FILE_FLAG_BACKUP_SEMANTICS | win32file.FILE_FLAG_OVERLAPPED,
+                None,
+            )
+        except Exception as e:
+            logging.error(f"Failed to watch config directory: {e}")
+            self._running = False
+            # Let the owner notice the watcher is down and poll instead
+            self._callback()
+            return
+
+        filename = os.path.basename(self._config_file).lower()
+        overlapped = pywintypes.OVERLAPPED()
+        overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+        buffer = win32file.AllocateReadBuffer(1024)
+        pending = False
+        try:
+            while self._running:
+                win32file.ReadDirectoryChangesW(
+                    handle,
+                    buffer,
+                    False,
+                    win32con.FILE_NOTIFY_CHANGE_LAST_WRITE,
+                    overlapped,
+                )
+                pending = True
+                result = win32event.WaitForMultipleObjects(
+                    [overlapped.hEvent, self._stop_event], False, win32event.INFINITE
+                )
+                if result != win32event.WAIT_OBJECT_0:
+                    break
+                size = win32file.GetOverlappedResult(handle, overlapped, True)
+                pending = False
+                changes = win32file.FILE_NOTIFY_INFORMATION(buffer, size)
+                if any(name.lower() == filename for _action, name in changes):
+                    self._callback()
+        except Exception as e:
+            if self._running:
+                logging.error(f"Error watching config file: {e}")
+                self._running = False
+                self._callback()
+        finally:
+            self._running = False
+            try:
+                # The read must finish before its buffer and handle go away
+                if pending:
+                    win32file.CancelIo(handle)
+                    win32file.GetOverlappedResult(handle, overlapped, True)
+            except Exception:
+                pass
+            handle.Close()
+
+
 class AudioSwitcher:
     VERSION = "1.0.2"
 
@@ -151,10 +298,9 @@ class AudioSwitcher:
         self.root.protocol("WM_DELETE_WINDOW", self._on_root_close)
 
         # Initialize queues first before anything else
-        self.menu_event_queue = queue.Queue()
-        self.gui_queue = queue.Queue()
+        self.menu_event_queue = queue.SimpleQueue()
         # Add thread-safe queue for GUI operations
-        self.gui_action_queue = queue.Queue()
+        self.gui_action_queue = queue.SimpleQueue()
 
         # Initialize event loop
         self.loop = asyncio.new_event_loop()
@@ -183,24 +329,72 @@ class AudioSwitcher:
 
         # Initialize basic attributes first
         self.devices = {DeviceType.SPEAKER: [], DeviceType.HEADPHONE: []}
+        self._devices_by_id = {}
         self.current_type = DeviceType.SPEAKER
         self.current_device_index = {DeviceType.SPEAKER: 0, DeviceType.HEADPHONE: 0}
         self.hotkeys = {
             "switch_device": "ctrl+alt+s",
             "switch_type": "ctrl+alt+t",
         }
+        self._hotkey_handles = []
         self.kernel_mode_enabled = True
         self.force_start = False
+        self._startup_dirty = True
         self.startup_enabled = self.is_startup_enabled()
 
         # Add new attribute for process tracking
         self._svcl_processes = set()
 
+        # Short-lived cache for audio device enumeration
+        self._device_cache = None
+        self._device_cache_ts = 0.0
+        self._device_cache_ttl = 5.0  # seconds
+        self._devices_by_name = {}
+
+        # Cached pycaw endpoints by ID for post-switch verification
+        self._endpoint_cache = None
+        self._endpoint_cache_ts = 0.0
+        self._endpoint_cache_ttl = 2.0  # seconds
+
+        # Coalesce rapid interface refreshes into a single rebuild
+        self._refresh_pending = False
+        self._refresh_timer = None
+        self._refresh_lock = Lock()
+
+        # Coalesce rapid config writes into a single delayed flush
+        self._config_dirty = False
+        self._save_timer = None
+        self._save_delay = 0.25  # seconds
+        self._save_lock = RLock()
+
+        # State hash of the last rendered menu, None forces a rebuild
+        self._last_menu_fingerprint = None
+
+        # Static tray menu sections, built on first create_menu call
+        self._static_menu_items = None
+
+        # Per-instance memo of foreground window -> matching app patterns,
+        # keyed by table generation and cleared whenever app_device_map is
+        # replaced
+        self._match_app = functools.lru_cache(maxsize=256)(self._find_app_matches)
+        # (exact pattern index, scanned pattern list), swapped as one object
+        self._match_tables = ({}, [])
+        self._match_generation = 0
         self.app_device_map = {}
         self.auto_switch_enabled = False
         self.process_monitor = None
+        # Trailing-edge debounce for foreground process changes
+        self._focus_timer = None
+        self._focus_debounce = 0.15  # seconds
+        self._focus_lock = Lock()
+        # Single worker serializes matching and device switching off UI threads
+        self._match_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Match")
+        self.config_watcher = None
+        self._config_file_changed = False
+        # Stat polling of the config file, only used while the watcher is down
+        self._config_poll_interval = 1000  # milliseconds
+        self._config_poll_after_id = None
         self.mapping_gui = None
-        self.gui_queue = queue.Queue()
 
         # Make sure root processes events
         self.root.update_idletasks()
@@ -243,22 +437,39 @@ class AudioSwitcher:
             os.makedirs(self.resources_dir, exist_ok=True)
             os.makedirs(self.logs_dir, exist_ok=True)
 
+            # Resource locations, resolved once. The frozen/script branch
+            # above already covers the executable and script directories.
+            self._resource_search_dirs = (
+                self.resources_dir,
+                os.path.join(os.getcwd(), "resources"),
+                os.getcwd(),
+            )
+            # Per-instance memo of resource lookups
+            self._find_resource = functools.lru_cache(maxsize=32)(
+                self._search_resource
+            )
+
             # Find svcl.exe
             self.soundvolumeview_path = self._find_resource("svcl.exe")
             if not self.soundvolumeview_path:
                 raise FileNotFoundError("svcl.exe not found in any expected location")
 
+            # Build hidden-window process info once for every svcl call
+            self._svcl_startupinfo = subprocess.STARTUPINFO()
+            self._svcl_startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            self._svcl_startupinfo.wShowWindow = win32con.SW_HIDE
+
             # Find icon.png for tray
             self.icon_path = self._find_resource("icon.png")
             if not self.icon_path:
                 raise FileNotFoundError("icon.png not found in any expected location")
+            self._resolved_icon_path = self._compute_icon_path()
 
             # Initialize notification system
             try:
+                # Set up synchronously on this thread; raises on failure
                 self.notifier = OverlayNotification()
-                # Wait for notification system to be ready
-                self.notifier._setup_done.wait(timeout=5.0)
-                if not self.notifier._active:
+                if not self.notifier._ready:
                     raise RuntimeError("Notification system failed to initialize")
                 logging.debug("Overlay notification system initialized")
             except Exception as e:
@@ -268,6 +479,7 @@ class AudioSwitcher:
             # Initialize basic attributes
             self.config_file = "config.json"
             self.devices = {DeviceType.SPEAKER: [], DeviceType.HEADPHONE: []}
+            self._devices_by_id = {}
             self.current_type = DeviceType.SPEAKER
             self.current_device_index = {DeviceType.SPEAKER: 0, DeviceType.HEADPHONE: 0}
             self.hotkeys = {
@@ -287,6 +499,14 @@ class AudioSwitcher:
             self.device_listener = AudioDeviceListener(self._handle_device_change)
             self.device_listener.start()
 
+            # Watch config file so process changes only reload when it was written
+            self.config_watcher = ConfigFileWatcher(
+                self.config_file, self._on_config_file_changed
+            )
+            self.config_watcher.start()
+            # Runs once mainloop starts; picks up writes seen before then
+            self.root.after(0, self._apply_config_file_change)
+
             # Initialize process monitor if auto-switch is enabled
             if self.auto_switch_enabled:
                 self.start_process_monitor()
@@ -308,15 +528,15 @@ class AudioSwitcher:
         # Start async event processing
         self.loop.create_task(self._process_gui_events())
 
-        # Create GUI thread for handling Tkinter operations
-        self.gui_thread = Thread(target=self._run_gui_loop, daemon=True)
-        self.gui_thread.start()
-
-        # Wait for GUI thread to initialize
-        time.sleep(0.1)
-
         self.gui_process = None
-        self.gui_queue = Queue()  # For communication with GUI process
+        self.gui_conn = None  # Messages from GUI process
+        self.gui_in_queue = None  # Commands to the GUI process
+
+        # Adaptive poll interval for the GUI queue (milliseconds)
+        self._gui_poll_min = 50
+        self._gui_poll_max = 1000
+        self._gui_poll_interval = self._gui_poll_min
+        self._gui_poll_after_id = None
 
         # Add freeze support for Windows
         if __name__ == "__main__":
@@ -345,25 +565,6 @@ class AudioSwitcher:
             except Exception as e:
                 logging.error(f"Error in event processing: {e}")
 
-    def _run_gui_loop(self):
-        """Run Tkinter event loop in a dedicated thread"""
-        try:
-            while self._active:
-                if self.root and self.root.winfo_exists():
-                    try:
-                        self.root.update()
-                        # Check config file every second
-                        self._check_config_changes()
-                        time.sleep(0.1)  # Prevent high CPU usage
-                    except tk.TclError as e:
-                        if "application has been destroyed" not in str(e):
-                            logging.error(f"Tkinter error in GUI loop: {e}")
-                            break
-                else:
-                    break
-        except Exception as e:
-            logging.error(f"Error in GUI loop: {e}")
-
     def _load_debug_setting(self):
         """Load debug mode setting from config"""
         try:
@@ -453,6 +654,7 @@ class AudioSwitcher:
         """Initialize tray icon separately"""
         logging.debug("Initializing tray icon...")
         self.setup_tray()
+        self._register_hotkeys()
         # Create and start tray thread
         self.tray_thread = Thread(target=self._run_tray, daemon=True, name="TrayThread")
         self.tray_thread.start()
@@ -462,6 +664,30 @@ class AudioSwitcher:
             raise RuntimeError("Tray thread failed to start")
         logging.info("Tray icon initialized successfully")
 
+    def _register_hotkeys(self):
+        """Register global hotkeys from scan codes parsed once"""
+        logging.debug("Setting up hotkeys...")
+        bindings = (
+            ("switch_device", self.switch_audio_device),
+            ("switch_type", self.switch_device_type),
+        )
+        for name, callback in bindings:
+            parsed = keyboard.parse_hotkey(self.hotkeys[name])
+            handle = keyboard.add_hotkey(
+                parsed, callback, suppress=False, trigger_on_release=False
+            )
+            self._hotkey_handles.append(handle)
+        logging.debug("Hotkeys registered")
+
+    def _unregister_hotkeys(self):
+        """Remove only the hotkeys registered by this instance"""
+        for handle in self._hotkey_handles:
+            try:
+                keyboard.remove_hotkey(handle)
+            except (KeyError, ValueError) as e:
+                logging.debug(f"Hotkey already removed: {e}")
+        self._hotkey_handles.clear()
+
     def setup_logging(self):
         """Setup logging configuration"""
         try:
@@ -535,28 +761,16 @@ class AudioSwitcher:
                     DeviceType.SPEAKER: speakers,
                     DeviceType.HEADPHONE: headphones,
                 }
+                self._reindex_devices()
                 self.hotkeys = config.get("hotkeys", self.hotkeys)
                 self.current_type = DeviceType(
                     config.get("current_type", DeviceType.SPEAKER.value)
                 )
 
                 # Load new settings with proper conversion
-                self.app_device_map.clear()  # Clear existing mappings
-                raw_mappings = config.get("app_device_map", {})
-                for app, settings in raw_mappings.items():
-                    if isinstance(settings, dict):
-                        self.app_device_map[app] = {
-                            "type": str(settings.get("type", "Speakers")),
-                            "device_id": str(settings.get("device_id", "")),
-                            "disabled": bool(settings.get("disabled", False)),
-                        }
-                    else:
-                        # Handle legacy format
-                        self.app_device_map[app] = {
-                            "type": "Speakers",
-                            "device_id": str(settings),
-                            "disabled": False,
-                        }
+                self._set_app_device_map(
+                    self._parse_app_map(config.get("app_device_map", {}))
+                )
 
                 logging.info(f"Loaded {len(self.app_device_map)} application mappings")
                 logging.debug(f"Loaded mappings: {self.app_device_map}")
@@ -566,11 +780,17 @@ class AudioSwitcher:
             self.kernel_mode_enabled = True
             self.force_start = False
             self.debug_mode = False
-            self.app_device_map = {}
+            self._set_app_device_map({})
             self.auto_switch_enabled = False
             self.save_config()
 
     def save_config(self):
+        """Save configuration immediately, superseding any pending flush"""
+        with self._save_lock:
+            self._config_dirty = False
+            return self._write_config()
+
+    def _write_config(self):
         """Save configuration with validation and backup"""
         try:
             # Load current config first
@@ -591,14 +811,8 @@ class AudioSwitcher:
                     "debug_mode": self.debug_mode,
                     "auto_switch_enabled": self.auto_switch_enabled,
                     "app_device_map": {
-                        app: {
-                            "type": str(settings["type"]),
-                            "device_id": str(settings["device_id"]),
-                            "disabled": bool(settings.get("disabled", False)),
-                        }
-                        for app, settings in current_config.get(
-                            "app_device_map", {}
-                        ).items()
+                        app: mapping._asdict()
+                        for app, mapping in self.app_device_map.items()
                     },
                 }
             )
@@ -613,19 +827,16 @@ class AudioSwitcher:
                 except Exception as e:
                     logging.warning(f"Failed to create backup: {e}")
 
-            # Save merged config
+            # Encode fully before opening so a failure leaves no partial file
+            payload = json.dumps(current_config, indent=4, ensure_ascii=False)
             with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(current_config, f, indent=4, ensure_ascii=False)
+                f.write(payload)
 
-            # Verify the save
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                saved_data = json.load(f)
-                saved_mappings = len(saved_data.get("app_device_map", {}))
-                logging.info(
-                    f"Config saved successfully with {saved_mappings} mappings"
-                )
-                if os.path.exists(backup_file):
-                    os.remove(backup_file)
+            logging.info(
+                f"Config saved successfully with {len(self.app_device_map)} mappings"
+            )
+            if os.path.exists(backup_file):
+                os.remove(backup_file)
 
             # Update last modified time
             self._last_config_modified = os.path.getmtime(self.config_file)
@@ -639,22 +850,16 @@ class AudioSwitcher:
         """Reload configuration from file"""
         try:
             logging.info("Reloading configuration")
-            old_map = self.app_device_map.copy()
+            old_map = self.app_device_map
 
             # Load fresh config
             with open(self.config_file, "r") as f:
                 config = json.load(f)
 
             # Update app mappings
-            self.app_device_map.clear()
-            raw_mappings = config.get("app_device_map", {})
-            for app, settings in raw_mappings.items():
-                if isinstance(settings, dict):
-                    self.app_device_map[app] = {
-                        "type": str(settings.get("type", "Speakers")),
-                        "device_id": str(settings.get("device_id", "")),
-                        "disabled": bool(settings.get("disabled", False)),
-                    }
+            self._set_app_device_map(
+                self._parse_app_map(config.get("app_device_map", {}))
+            )
 
             if self.app_device_map != old_map:
                 logging.info(
@@ -662,7 +867,7 @@ class AudioSwitcher:
                 )
                 logging.debug(f"New mappings: {self.app_device_map}")
                 self._last_config_modified = os.path.getmtime(self.config_file)
-                self._refresh_interface()  # Update UI
+                self._schedule_refresh()  # Update UI
                 return True
 
             return False
@@ -671,8 +876,67 @@ class AudioSwitcher:
             logging.error(f"Failed to reload config: {e}", exc_info=True)
             return False
 
+    def _parse_app_map(self, raw_mappings):
+        """Convert raw config mappings into AppMapping records"""
+        mappings = {}
+        for app, settings in raw_mappings.items():
+            if isinstance(settings, dict):
+                mappings[app] = AppMapping(
+                    type=str(settings.get("type", "Speakers")),
+                    device_id=str(settings.get("device_id", "")),
+                    disabled=bool(settings.get("disabled", False)),
+                )
+            else:
+                # Handle legacy format
+                mappings[app] = AppMapping(type="Speakers", device_id=str(settings))
+        return mappings
+
+    def _reindex_devices(self):
+        """Index configured devices by type and id for O(1) lookups"""
+        self._devices_by_id = {}
+        for device_type, devices in self.devices.items():
+            for device in devices:
+                self._devices_by_id.setdefault((device_type, device.get("id")), device)
+
+    def _set_app_device_map(self, mappings):
+        """Replace app mappings and drop cached match results"""
+        self.app_device_map = mappings
+        # Lowercase and split enabled patterns once for the matching hot path.
+        # Every pattern is indexed for exact lookup; only those that can also
+        # match as a substring or by words go into the scanned list.
+        exact_patterns = {}
+        compiled_patterns = []
+        for app_pattern, mapping in mappings.items():
+            if mapping.disabled:
+                continue
+            pattern = app_pattern.lower()
+            exact_patterns.setdefault(pattern, []).append(app_pattern)
+
+            parts = pattern.split()
+            multi_parts = tuple(parts) if len(parts) > 1 else ()
+            searchable = len(pattern) > 3
+            if multi_parts or searchable:
+                # Both match modes need every non-space character present
+                mask = _char_mask("".join(parts))
+                compiled_patterns.append(
+                    (app_pattern, pattern, multi_parts, searchable, mask)
+                )
+
+        # The Match worker reads these concurrently: publish fully built
+        # tables in one assignment, then bump the generation so a match still
+        # running on the old tables caches under a key nobody asks for again
+        self._match_tables = (exact_patterns, compiled_patterns)
+        self._match_generation += 1
+        self._match_app.cache_clear()
+
     def get_audio_devices(self):
         """Get audio devices using Windows Audio API directly"""
+        if (
+            self._device_cache is not None
+            and time.monotonic() - self._device_cache_ts < self._device_cache_ttl
+        ):
+            return list(self._device_cache)
+
         output_devices = []
         try:
             # Ensure COM is initialized for this thread
@@ -686,6 +950,9 @@ class AudioSwitcher:
             # Get all devices directly from MMDeviceEnumerator
             devices = AudioUtilities.GetAllDevices()
 
+            # Query sounddevice once for index compatibility
+            sd_devices = sd.query_devices()
+
             # Filter and process devices
             for device in devices:
                 try:
@@ -694,7 +961,6 @@ class AudioSwitcher:
                     sys_id = device.id
 
                     # Get index from sounddevice for compatibility
-                    sd_devices = sd.query_devices()
                     index = next(
                         (
                             i
@@ -734,8 +1000,16 @@ class AudioSwitcher:
                 logging.error(f"Debug logging failed: {e}")
 
             logging.warning("No audio output devices found!")
+        else:
+            self._device_cache = output_devices
+            self._device_cache_ts = time.monotonic()
+
+        # Index by name for O(1) lookups, keeping the first of any duplicates
+        self._devices_by_name = {}
+        for device in output_devices:
+            self._devices_by_name.setdefault(device["name"], device)
 
-        return output_devices
+        return list(output_devices)
 
     def switch_device_type(self):
         logging.info(f"Switching device type from {self.current_type}")
@@ -760,7 +1034,7 @@ class AudioSwitcher:
                 "Warning", f"No {self.current_type.value} devices configured"
             )
 
-        self.save_config()
+        self._schedule_config_flush()
         logging.info(f"Switched to {self.current_type}")
 
     def switch_audio_device(self):
@@ -812,53 +1086,67 @@ class AudioSwitcher:
             except Exception as e:
                 logging.error(f"Error in event processing: {e}")
 
+    def _drain_actions(self, action_queue):
+        """Pull all pending actions in one pass, collapsing duplicates"""
+        actions = []
+        try:
+            while True:
+                actions.append(action_queue.get_nowait())
+        except queue.Empty:
+            pass
+        # Keep first-seen order while dropping repeated requests
+        return list(dict.fromkeys(actions))
+
     def _process_gui_actions(self):
         """Process queued GUI actions"""
         try:
-            while True:  # Process all pending actions
-                action = self.gui_action_queue.get_nowait()
+            for action in self._drain_actions(self.gui_action_queue):
                 if action == "show_mapping":
                     self._create_mapping_gui_safe()
-        except queue.Empty:
-            pass
         except Exception as e:
             logging.error(f"Error processing GUI action: {e}")
 
     def _process_menu_events(self):
         """Process queued menu events"""
         try:
-            while True:
-                try:
-                    action = self.menu_event_queue.get_nowait()
-                    if action == "show_mapping":
-                        if self.root and self.root.winfo_exists():
-                            self._create_mapping_gui_safe()
-                except queue.Empty:
-                    break
+            for action in self._drain_actions(self.menu_event_queue):
+                if action == "show_mapping":
+                    if self.root and self.root.winfo_exists():
+                        self._create_mapping_gui_safe()
         except Exception as e:
             logging.error(f"Error processing menu events: {e}")
 
+    @staticmethod
+    def _truncate_tray_text(text):
+        """Shorten text to fit the tray balloon limit"""
+        return text if len(text) <= 63 else text[:60] + "..."
+
     def show_notification(self, title, message):
         """Show both tray and overlay notifications with error handling"""
         try:
             # Show overlay notification first
             if self._active and self.notifier:
+                notifier = self.notifier
                 try:
-                    # Queue notification and force immediate processing
-                    self.notifier.show_notification(title, message, duration=2.5)
-                    if hasattr(self.notifier, "root") and self.notifier.root:
-                        self.notifier.root.event_generate("<<ProcessQueue>>")
+                    notifier.show_notification(title, message, duration=2.5)
                 except Exception as e:
                     logging.warning(f"Overlay notification failed: {e}")
+                else:
+                    # Wake the notifier through mainloop(), which marshals
+                    # calls from other threads onto the Tk thread
+                    try:
+                        self.root.after(0, notifier.process_queue)
+                    except (RuntimeError, tk.TclError) as e:
+                        # mainloop not running yet; the notifier's poll shows it
+                        logging.debug(f"Failed to wake notifier: {e}")
 
             # Show tray notification
-            if self.icon and self._active:
+            if getattr(self, "icon", None) is not None and self._active:
                 try:
-                    tray_title = (title[:60] + "...") if len(title) > 63 else title
-                    tray_message = (
-                        (message[:60] + "...") if len(message) > 63 else message
+                    self.icon.notify(
+                        self._truncate_tray_text(title),
+                        self._truncate_tray_text(message),
                     )
-                    self.icon.notify(tray_title, tray_message)
                 except Exception as e:
                     logging.warning(f"Tray notification failed: {e}")
 
@@ -879,10 +1167,8 @@ class AudioSwitcher:
                     f"Invalid device ID format for {device_name}, refreshing device info"
                 )
                 # Get fresh device info
-                devices = self.get_audio_devices()
-                matching_device = next(
-                    (d for d in devices if d["name"] == device_name), None
-                )
+                self.get_audio_devices()
+                matching_device = self._devices_by_name.get(device_name)
                 if matching_device:
                     device_id = matching_device["id"]
                 else:
@@ -890,11 +1176,6 @@ class AudioSwitcher:
 
             logging.info(f"Setting default device: {device_name} (ID: {device_id})")
 
-            # Set up process info
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = win32con.SW_HIDE
-
             # Set as default for all roles in one command
             cmd_playback = [self.soundvolumeview_path, "/SetDefault", device_id, "all"]
             result = subprocess.run(
@@ -902,17 +1183,13 @@ class AudioSwitcher:
                 check=True,
                 capture_output=True,
                 text=True,
-                startupinfo=startupinfo,
+                startupinfo=self._svcl_startupinfo,
                 creationflags=win32process.CREATE_NO_WINDOW,
             )
 
             # Quick verification using Windows API
             try:
-                from pycaw.pycaw import AudioUtilities
-
-                devices = AudioUtilities.GetAllDevices()
-                default_device = next((d for d in devices if d.id == device_id), None)
-                if not default_device:
+                if device_id not in self._get_endpoints_by_id():
                     logging.warning("Device not found in default devices after setting")
                     return False
             except Exception as e:
@@ -929,6 +1206,21 @@ class AudioSwitcher:
             logging.error(traceback.format_exc())
             return False
 
+    def _get_endpoints_by_id(self):
+        """Get pycaw endpoints keyed by system ID, cached for a short time"""
+        now = time.monotonic()
+        if (
+            self._endpoint_cache is None
+            or now - self._endpoint_cache_ts >= self._endpoint_cache_ttl
+        ):
+            from pycaw.pycaw import AudioUtilities
+
+            # Hotkey callbacks run on the keyboard library's own thread
+            _ensure_com_initialized()
+            self._endpoint_cache = {d.id: d for d in AudioUtilities.GetAllDevices()}
+            self._endpoint_cache_ts = now
+        return self._endpoint_cache
+
     def setup_tray(self):
         try:
             logging.debug("Setting up system tray icon...")
@@ -966,25 +1258,20 @@ class AudioSwitcher:
             current_device = "No device selected"
             if self.devices[self.current_type]:
                 first_device = self.devices[self.current_type][0]
-                device_idx = first_device["index"]
-                current_device = sd.query_devices(device_idx)["name"]
+                try:
+                    current_device = sd.query_devices(first_device["index"])["name"]
+                except Exception as e:
+                    logging.warning(f"Failed to query current device name: {e}")
 
+            logging.debug("Initializing system tray icon...")
             self.icon = pystray.Icon(
                 "audio_switcher",
                 image,
                 f"Audio Switcher\n{self.current_type.value}: {current_device}",
                 menu,
             )
-
-            logging.debug("Initializing system tray icon...")
-            self.icon = pystray.Icon("audio_switcher", image, "Audio Switcher", menu)
             logging.debug("System tray icon initialized")
 
-            logging.debug("Setting up hotkeys...")
-            keyboard.add_hotkey(self.hotkeys["switch_device"], self.switch_audio_device)
-            keyboard.add_hotkey(self.hotkeys["switch_type"], self.switch_device_type)
-            logging.debug("Hotkeys registered")
-
             self.tray_thread = Thread(target=self._run_tray, daemon=True)
             self.tray_thread.start()
             logging.info("Tray icon thread started")
@@ -1030,15 +1317,73 @@ class AudioSwitcher:
                 logging.info(f"Setting {device['name']} as default")
                 self.set_default_audio_device(device)
 
-            # Force immediate menu update
-            self._refresh_interface()
+            # Schedule menu update
+            self._schedule_refresh()
 
         except Exception as e:
             logging.error(f"Error handling device click: {e}", exc_info=True)
 
+    def _schedule_refresh(self):
+        """Coalesce rapid refresh requests into a single interface rebuild"""
+        with self._refresh_lock:
+            if self._refresh_pending:
+                return
+            self._refresh_pending = True
+            self._refresh_timer = Timer(0.1, self._do_refresh)
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Run the pending interface refresh"""
+        with self._refresh_lock:
+            self._refresh_pending = False
+            self._refresh_timer = None
+        if self._active:
+            self._refresh_interface()
+
+    def _schedule_config_flush(self):
+        """Mark config dirty and arm a single delayed save"""
+        with self._save_lock:
+            self._config_dirty = True
+            if self._save_timer is None:
+                self._save_timer = Timer(self._save_delay, self._flush_config)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _flush_config(self):
+        """Write config now if changes are pending"""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._config_dirty:
+                self.save_config()
+
+    def _menu_fingerprint(self):
+        """Hash of the state that affects the tray menu and title"""
+        return hash(
+            (
+                tuple(
+                    tuple(d.get("id", str(d["index"])) for d in self.devices[dt])
+                    for dt in DeviceType
+                ),
+                tuple(self.current_device_index[dt] for dt in DeviceType),
+                self.current_type,
+                self.kernel_mode_enabled,
+                self.startup_enabled,
+                self.debug_mode,
+                self.auto_switch_enabled,
+            )
+        )
+
     def _refresh_interface(self):
-        """Force refresh of all UI elements"""
+        """Refresh all UI elements if menu state changed"""
         try:
+            fingerprint = self._menu_fingerprint()
+            if fingerprint == self._last_menu_fingerprint:
+                logging.debug("Menu state unchanged, skipping refresh")
+                return
+
             # Update menu structure
             menu = self.create_menu()
             self.icon.menu = menu
@@ -1057,29 +1402,37 @@ class AudioSwitcher:
             self.icon.remove_notification()  # Clear any existing notifications
             self.icon.visible = True  # Ensure icon is visible
 
+            self._last_menu_fingerprint = fingerprint
+
         except Exception as e:
             logging.error(f"Error refreshing interface: {e}")
 
     def create_menu(self):
         try:
+            # Precompute configured/current device IDs for O(1) membership checks
+            active_ids = {}
+            current_id = {}
+            for dt in DeviceType:
+                configured = self.devices[dt]
+                active_ids[dt] = {d.get("id", str(d["index"])) for d in configured}
+                current_id[dt] = (
+                    configured[self.current_device_index[dt]].get("id")
+                    if dt == self.current_type and configured
+                    else None
+                )
 
             def make_group_menu(devices, device_type, group_name):
                 items = []
                 # Create a dictionary to track name occurrences
                 name_counter = {}
 
-                for device in sorted(devices, key=lambda x: x["name"]):
+                # Devices arrive pre-sorted by name from make_device_menu
+                for device in devices:
                     device_id = device.get("id", str(device["index"]))
-                    is_active = device_id in [
-                        d.get("id", str(d["index"])) for d in self.devices[device_type]
-                    ]
+                    is_active = device_id in active_ids[device_type]
                     is_current = (
-                        device_type == self.current_type
-                        and self.devices[device_type]
-                        and device_id
-                        == self.devices[device_type][
-                            self.current_device_index[device_type]
-                        ].get("id")
+                        current_id[device_type] is not None
+                        and device_id == current_id[device_type]
                     )
 
                     name = device["name"].replace(group_name, "").strip()
@@ -1095,23 +1448,20 @@ class AudioSwitcher:
                     elif is_active:
                         name = f"✓ {name}"
 
-                    def make_callback(dev=device, typ=device_type):
-                        def callback(icon, item):
-                            self.handle_device_click(dev, typ)
-
-                        return callback
-
+                    # pystray inspects action.__code__, so a single lambda is
+                    # used here rather than functools.partial
                     items.append(
                         pystray.MenuItem(
                             text=name,
-                            action=make_callback(),
-                            checked=lambda item, _is_active=is_active: _is_active,
+                            action=lambda icon, item, dev=device, typ=device_type: (
+                                self.handle_device_click(dev, typ)
+                            ),
+                            checked=_menu_checked if is_active else _menu_unchecked,
                         )
                     )
                 return items
 
-            def make_device_menu(device_type):
-                devices = self.get_audio_devices()
+            def make_device_menu(device_type, devices):
                 if not devices:
                     return [
                         pystray.MenuItem(
@@ -1119,16 +1469,13 @@ class AudioSwitcher:
                         )
                     ]
 
-                groups = {}
-                for device in devices:
-                    group = device["name"].split(" ", 1)[0]
-                    if group not in groups:
-                        groups[group] = []
-                    groups[group].append(device)
+                # Sort once; groups keep insertion order, so they come out sorted
+                groups = defaultdict(list)
+                for device in sorted(devices, key=lambda d: d["name"]):
+                    groups[device["name"].split(" ", 1)[0]].append(device)
 
                 menu_items = []
-                for group_name in sorted(groups.keys()):
-                    group_devices = groups[group_name]
+                for group_name, group_devices in groups.items():
                     menu_items.append(
                         pystray.MenuItem(
                             text=group_name,
@@ -1139,6 +1486,13 @@ class AudioSwitcher:
                     )
                 return menu_items
 
+            # Enumerate once and share between the speaker/headphone menus
+            devices = self.get_audio_devices()
+
+            # Controls and footer never change, so build them only once
+            if self._static_menu_items is None:
+                self._static_menu_items = self._build_static_menu_items()
+
             menu_items = [
                 pystray.MenuItem(
                     text=f"● {self.current_type.value}", action=None, enabled=False
@@ -1146,66 +1500,16 @@ class AudioSwitcher:
                 pystray.Menu.SEPARATOR,
                 pystray.MenuItem(
                     text="🔊 Speakers",
-                    action=pystray.Menu(*make_device_menu(DeviceType.SPEAKER)),
+                    action=pystray.Menu(*make_device_menu(DeviceType.SPEAKER, devices)),
                 ),
                 pystray.MenuItem(
                     text="🎧 Headphones",
-                    action=pystray.Menu(*make_device_menu(DeviceType.HEADPHONE)),
-                ),
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem(
-                    text="⌨️ Controls",
                     action=pystray.Menu(
-                        pystray.MenuItem(
-                            text=f"Switch Device ({self.hotkeys['switch_device']})",
-                            action=lambda _: self.switch_audio_device(),
-                        ),
-                        pystray.MenuItem(
-                            text=f"Switch Type ({self.hotkeys['switch_type']})",
-                            action=lambda _: self.switch_device_type(),
-                        ),
-                        pystray.Menu.SEPARATOR,
-                        pystray.MenuItem(
-                            text="🔒 Kernel Mode",
-                            action=lambda _: self.toggle_kernel_mode(),
-                            checked=lambda _: self.kernel_mode_enabled,
-                        ),
-                        pystray.MenuItem(
-                            text="🚀 Start with Windows",
-                            action=lambda _: self.toggle_startup(),
-                            checked=lambda _: self.startup_enabled,
-                        ),
-                        pystray.MenuItem(
-                            text="🔧 Debug Mode",
-                            action=lambda _: self.toggle_debug_mode(),
-                            checked=lambda _: self.debug_mode,
-                        ),
-                        pystray.Menu.SEPARATOR,
-                        pystray.MenuItem(
-                            text="🔄 Auto-Switch",
-                            action=lambda _: self.toggle_auto_switch(),
-                            checked=lambda _: self.auto_switch_enabled,
-                        ),
-                        pystray.MenuItem(
-                            text="⚙️ Configure App Mappings",
-                            action=lambda _: self.show_mapping_gui(),
-                        ),
+                        *make_device_menu(DeviceType.HEADPHONE, devices)
                     ),
                 ),
                 pystray.Menu.SEPARATOR,
-                pystray.MenuItem(
-                    text="❌ Exit", action=lambda _: self.cleanup_and_exit()
-                ),
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem(
-                    text=f"⏳ Version {self.VERSION}",
-                    action=lambda _: self.update_checker.open_download_page(),
-                ),
-                pystray.MenuItem(
-                    text="🔄 Check for Updates",
-                    action=lambda _: self.check_for_updates(),
-                ),
-                pystray.MenuItem(text="ℹ️ Made by Tamaisme", action=None, enabled=False),
+                *self._static_menu_items,
             ]
 
             return pystray.Menu(*menu_items)
@@ -1214,13 +1518,82 @@ class AudioSwitcher:
             logging.error(f"Error creating menu: {e}", exc_info=True)
             return self.create_fallback_menu()
 
+    def _build_static_menu_items(self):
+        """Build the Controls submenu and footer items shared by every menu"""
+        return (
+            pystray.MenuItem(
+                text="⌨️ Controls",
+                action=pystray.Menu(
+                    pystray.MenuItem(
+                        text=f"Switch Device ({self.hotkeys['switch_device']})",
+                        action=self.switch_audio_device,
+                    ),
+                    pystray.MenuItem(
+                        text=f"Switch Type ({self.hotkeys['switch_type']})",
+                        action=self.switch_device_type,
+                    ),
+                    pystray.Menu.SEPARATOR,
+                    pystray.MenuItem(
+                        text="🔒 Kernel Mode",
+                        action=self.toggle_kernel_mode,
+                        checked=self._is_kernel_mode_checked,
+                    ),
+                    pystray.MenuItem(
+                        text="🚀 Start with Windows",
+                        action=self.toggle_startup,
+                        checked=self._is_startup_checked,
+                    ),
+                    pystray.MenuItem(
+                        text="🔧 Debug Mode",
+                        action=self.toggle_debug_mode,
+                        checked=self._is_debug_mode_checked,
+                    ),
+                    pystray.Menu.SEPARATOR,
+                    pystray.MenuItem(
+                        text="🔄 Auto-Switch",
+                        action=self.toggle_auto_switch,
+                        checked=self._is_auto_switch_checked,
+                    ),
+                    pystray.MenuItem(
+                        text="⚙️ Configure App Mappings",
+                        action=self.show_mapping_gui,
+                    ),
+                ),
+            ),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem(text="❌ Exit", action=self.cleanup_and_exit),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem(
+                text=f"⏳ Version {self.VERSION}",
+                action=self._open_download_page,
+            ),
+            pystray.MenuItem(
+                text="🔄 Check for Updates",
+                action=self.check_for_updates,
+            ),
+            pystray.MenuItem(text="ℹ️ Made by Tamaisme", action=None, enabled=False),
+        )
+
+    def _is_kernel_mode_checked(self, item):
+        return self.kernel_mode_enabled
+
+    def _is_startup_checked(self, item):
+        return self.startup_enabled
+
+    def _is_debug_mode_checked(self, item):
+        return self.debug_mode
+
+    def _is_auto_switch_checked(self, item):
+        return self.auto_switch_enabled
+
+    def _open_download_page(self):
+        self.update_checker.open_download_page()
+
     def toggle_device(self, device_info, device_type):
         """Toggle device in configuration with menu update"""
         try:
             device_id = device_info.get("id", str(device_info["index"]))
-            existing = next(
-                (d for d in self.devices[device_type] if d.get("id") == device_id), None
-            )
+            existing = self._devices_by_id.get((device_type, device_id))
 
             if existing:
                 # Don't allow removing the last device of current type
@@ -1234,6 +1607,7 @@ class AudioSwitcher:
                     return False
 
                 self.devices[device_type].remove(existing)
+                self._reindex_devices()
                 action = "removed from"
 
                 # If this was the current device, switch to another one
@@ -1250,9 +1624,10 @@ class AudioSwitcher:
                     "name": device_info["name"],
                 }
                 self.devices[device_type].append(new_device)
+                self._reindex_devices()
                 action = "added to"
 
-            self.save_config()
+            self._schedule_config_flush()
             self.show_notification(
                 "Device Configuration",
                 f"{device_info['name']} {action} {device_type.value}",
@@ -1300,17 +1675,29 @@ class AudioSwitcher:
             if hasattr(self, "notification_thread"):
                 self.notification_thread.join(timeout=1.0)
 
+            # Cancel pending interface refresh
+            if self._refresh_timer:
+                self._refresh_timer.cancel()
+
+            # Flush any pending config save
+            self._flush_config()
+
             # Stop device monitoring
             if hasattr(self, "device_listener"):
                 self.device_listener.stop()
 
-            # Stop process monitor
-            if self.process_monitor:
-                self.process_monitor.stop()
-                self.process_monitor = None
+            # Stop config watcher
+            if self.config_watcher:
+                self.config_watcher.stop()
+                self.config_watcher = None
+
+            # Stop process monitor; this cancels the pending focus timer, the
+            # only source of match jobs, so there is nothing queued to cancel
+            self.stop_process_monitor()
+            self._match_pool.shutdown(wait=False)
 
             # Unhook keyboard
-            keyboard.unhook_all()
+            self._unregister_hotkeys()
 
             # Stop tray icon last
             if hasattr(self, "icon"):
@@ -1321,14 +1708,19 @@ class AudioSwitcher:
                 self.root.quit()
                 self.root.destroy()
 
-            # Wait for GUI thread to finish
-            if hasattr(self, "gui_thread") and self.gui_thread.is_alive():
-                self.gui_thread.join(timeout=1.0)
-
-            # Terminate GUI process if running
+            # Ask the GUI process to exit, terminate if it doesn't
             if self.gui_process and self.gui_process.is_alive():
-                self.gui_process.terminate()
-                self.gui_process.join(timeout=1.0)
+                try:
+                    self.gui_in_queue.put_nowait(("quit", None))
+                    self.gui_process.join(timeout=1.0)
+                except Exception as e:
+                    logging.debug(f"GUI process quit request failed: {e}")
+                if self.gui_process.is_alive():
+                    self.gui_process.terminate()
+                    self.gui_process.join(timeout=1.0)
+            if self.gui_conn:
+                self.gui_conn.close()
+                self.gui_conn = None
 
             # Clean up COM at the end
             CoUninitialize()
@@ -1358,6 +1750,11 @@ class AudioSwitcher:
         if not self._active:
             return
 
+        # Device set changed, force re-enumeration and menu rebuild
+        self._device_cache = None
+        self._endpoint_cache = None
+        self._last_menu_fingerprint = None
+
         if event_type == "connected":
             message = f"🔌 Audio device connected: {device_name}"
             logging.info(f"Device connected: {device_name} (ID: {device_id})")
@@ -1373,13 +1770,22 @@ class AudioSwitcher:
 
     def _remove_disconnected_device(self, device_id):
         """Remove disconnected device from configurations"""
+        self._device_cache = None
+        removed = False
         for device_type in DeviceType:
+            configured = self.devices[device_type]
+            if device_id not in {d.get("id", str(d["index"])) for d in configured}:
+                continue
+
             self.devices[device_type] = [
-                d
-                for d in self.devices[device_type]
-                if d.get("id", str(d["index"])) != device_id
+                d for d in configured if d.get("id", str(d["index"])) != device_id
             ]
-        self.save_config()
+            removed = True
+
+        # Nothing to persist if the device wasn't configured
+        if removed:
+            self._reindex_devices()
+            self._schedule_config_flush()
 
     def toggle_kernel_mode(self):
         """Toggle kernel mode setting"""
@@ -1394,10 +1800,9 @@ class AudioSwitcher:
             else:
                 message = "Kernel mode disabled"
 
-            self.save_config()
+            self._schedule_config_flush()
             self.show_notification("Kernel Mode", message)
-            self._refresh_interface()
-            self.icon.update_menu()
+            self._schedule_refresh()
 
         except Exception as e:
             logging.error(f"Error toggling kernel mode: {e}")
@@ -1475,27 +1880,35 @@ class AudioSwitcher:
             return False
 
     def is_startup_enabled(self):
-        """Check if application is set to run at startup"""
-        startup_folder = os.path.join(
-            os.getenv("APPDATA"), "Microsoft\\Windows\\Start Menu\\Programs\\Startup"
-        )
-        shortcut_path = os.path.join(startup_folder, "AudioSwitcher.lnk")
-        return os.path.exists(shortcut_path)
+        """Check if application is set to run at startup (cached)"""
+        if self._startup_dirty:
+            startup_folder = os.path.join(
+                os.getenv("APPDATA"),
+                "Microsoft\\Windows\\Start Menu\\Programs\\Startup",
+            )
+            shortcut_path = os.path.join(startup_folder, "AudioSwitcher.lnk")
+            self.startup_enabled = os.path.exists(shortcut_path)
+            self._startup_dirty = False
+        return self.startup_enabled
 
     def toggle_startup(self):
         """Toggle startup status"""
         try:
-            if self.is_startup_enabled():
+            was_enabled = self.is_startup_enabled()
+            if was_enabled:
                 success = self.remove_startup()
                 message = "Startup disabled" if success else "Failed to disable startup"
             else:
                 success = self.setup_startup()
                 message = "Startup enabled" if success else "Failed to enable startup"
 
-            self.startup_enabled = self.is_startup_enabled()
+            if success:
+                self.startup_enabled = not was_enabled
+            else:
+                # State is uncertain after a failed change, re-check next time
+                self._startup_dirty = True
             self.show_notification("Startup Settings", message)
-            self._refresh_interface()
-            self.icon.update_menu()
+            self._schedule_refresh()
         except Exception as e:
             logging.error(f"Error toggling startup: {e}")
             self.show_notification("Error", "Failed to toggle startup setting")
@@ -1512,28 +1925,21 @@ class AudioSwitcher:
                 logging.disable(logging.CRITICAL)
                 message = "Debug mode disabled"
 
-            self.save_config()
+            self._schedule_config_flush()
             self.show_notification("Debug Mode", message)
-            self._refresh_interface()
-            self.icon.update_menu()
+            self._schedule_refresh()
         except Exception as e:
             print(f"Error toggling debug mode: {e}")
 
-    def _find_resource(self, filename):
+    def _search_resource(self, filename):
         """Find a resource file in various locations"""
         search_paths = [
-            os.path.join(self.resources_dir, filename),
-            os.path.join(os.path.dirname(sys.executable), "resources", filename),
-            os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "resources", filename
-            ),
-            os.path.join(os.getcwd(), "resources", filename),
-            os.path.join(os.getcwd(), filename),
-            filename,
+            os.path.join(directory, filename)
+            for directory in self._resource_search_dirs
         ]
 
         for path in search_paths:
-            if path:
+            if os.path.exists(path):
                 logging.info(f"Found {filename} at: {path}")
                 return path
 
@@ -1550,15 +1956,34 @@ class AudioSwitcher:
         if self.process_monitor:
             self.process_monitor.stop()
             self.process_monitor = None
+        self._cancel_pending_match()
 
     def _handle_process_change(self, pid):
+        """Debounce foreground changes so only a stable focus is matched"""
+        with self._focus_lock:
+            if self._focus_timer:
+                self._focus_timer.cancel()
+            self._focus_timer = Timer(
+                self._focus_debounce,
+                self._match_pool.submit,
+                args=(self._do_match, pid),
+            )
+            self._focus_timer.daemon = True
+            self._focus_timer.start()
+
+    def _cancel_pending_match(self):
+        """Drop any debounced foreground change that hasn't fired yet"""
+        with self._focus_lock:
+            if self._focus_timer:
+                self._focus_timer.cancel()
+                self._focus_timer = None
+
+    def _do_match(self, pid):
         """Handle foreground process changes with window title matching"""
+        with self._focus_lock:
+            self._focus_timer = None
+
         try:
-            # Check if config has changed
-            if self._check_config_changes():
-                logging.info("Config changed, reloading settings")
-                self._force_reload_config()
-                
             import psutil
             import win32gui
             import win32process
@@ -1589,44 +2014,16 @@ class AudioSwitcher:
                 f"Active window - Process: {process_name} ({process_base_name}), Title: {window_title}"
             )
 
-            for app_pattern, device_config in self.app_device_map.items():
-                if device_config.get("disabled", False):
-                    continue
-
-                pattern = app_pattern.lower()
-                pattern_parts = pattern.split()
-
-                def all_parts_match(target):
-                    return all(part in target for part in pattern_parts)
-
-                is_match = (
-                    pattern == process_name
-                    or pattern == process_base_name
-                    or (len(pattern) > 3 and pattern in process_base_name)
-                    or (
-                        window_title
-                        and (
-                            pattern == window_title
-                            or (
-                                len(pattern_parts) > 1 and all_parts_match(window_title)
-                            )
-                            or (len(pattern) > 3 and pattern in window_title)
-                        )
-                    )
-                )
-
-                if is_match:
-                    device_type = DeviceType(device_config["type"])
-                    device_id = device_config["device_id"]
+            matches = self._match_app(
+                self._match_generation, process_name, process_base_name, window_title
+            )
+            for app_pattern in matches:
+                mapping = self.app_device_map.get(app_pattern)
+                if mapping and not mapping.disabled:
+                    device_type = DeviceType(mapping.type)
+                    device_id = mapping.device_id
 
-                    device = next(
-                        (
-                            d
-                            for d in self.devices[device_type]
-                            if d.get("id") == device_id
-                        ),
-                        None,
-                    )
+                    device = self._devices_by_id.get((device_type, device_id))
 
                     if device:
                         # Switch to this device
@@ -1634,19 +2031,58 @@ class AudioSwitcher:
                         self.set_default_audio_device(device)
                         match_type = (
                             "process name"
-                            if pattern in process_name
+                            if app_pattern.lower() in process_name
                             else "window title"
                         )
                         self.show_notification(
                             "Auto-Switched Device",
                             f"Switched to {device.get('name')} for {match_type}: {app_pattern}",
                         )
-                        self._refresh_interface()
+                        self._schedule_refresh()
                         break
 
         except Exception as e:
             logging.error(f"Error handling process change: {e}", exc_info=True)
 
+    def _find_app_matches(
+        self, generation, process_name, process_base_name, window_title
+    ):
+        """Return enabled app patterns matching the process or window title
+
+        Exact matches come first, followed by substring and multi-word matches.
+        generation only keys the cache to the tables it was computed from.
+        """
+        exact_patterns, compiled_patterns = self._match_tables
+        matches = []
+        exact_keys = (process_name, process_base_name)
+        if window_title:
+            exact_keys += (window_title,)
+        for key in exact_keys:
+            for app_pattern in exact_patterns.get(key, ()):
+                if app_pattern not in matches:
+                    matches.append(app_pattern)
+
+        # One substring scan covers both targets; the NUL separator keeps
+        # a pattern from matching across the boundary
+        haystack = f"{process_base_name}\0{window_title}"
+        haystack_len = len(haystack)
+        haystack_mask = _char_mask(haystack)
+
+        for entry in compiled_patterns:
+            app_pattern, pattern, multi_parts, searchable, mask = entry
+            # A character missing from both targets rules out either match
+            if mask & ~haystack_mask or app_pattern in matches:
+                continue
+            if (
+                searchable and len(pattern) <= haystack_len and pattern in haystack
+            ) or (
+                window_title
+                and multi_parts
+                and all(part in window_title for part in multi_parts)
+            ):
+                matches.append(app_pattern)
+        return tuple(matches)
+
     def toggle_auto_switch(self):
         """Toggle automatic device switching"""
         try:
@@ -1659,9 +2095,9 @@ class AudioSwitcher:
                 self.stop_process_monitor()
                 message = "Automatic switching disabled"
 
-            self.save_config()
+            self._schedule_config_flush()
             self.show_notification("Auto-Switch", message)
-            self._refresh_interface()
+            self._schedule_refresh()
 
         except Exception as e:
             logging.error(f"Error toggling auto-switch: {e}")
@@ -1669,6 +2105,10 @@ class AudioSwitcher:
 
     def get_icon_path(self):
         """Get path to icon file"""
+        return getattr(self, "_resolved_icon_path", None)
+
+    def _compute_icon_path(self):
+        """Resolve icon file path, preferring the ICO version"""
         if hasattr(self, "icon_path") and self.icon_path:
             # Return ICO version if it exists
             ico_path = self.icon_path.replace(".png", ".ico")
@@ -1678,116 +2118,143 @@ class AudioSwitcher:
         return None
 
     def show_mapping_gui(self):
-        """Launch mapping GUI in a separate process with data passing"""
+        """Show mapping GUI in a persistent worker process"""
         try:
             if not self._active:
                 return
 
-            # Kill any existing GUI process
-            if self.gui_process and self.gui_process.is_alive():
-                self.gui_process.terminate()
-                self.gui_process.join()
-
-            # Create fresh queue and prepare data
-            self.gui_queue = Queue()
-
             # Add icon path to GUI data
             icon_path = self.get_icon_path()
             
+            # Snapshot the device lists: the queue pickles them later on its
+            # feeder thread, while toggles may still be changing the live lists
             gui_data = {
                 "devices": {
-                    "Speakers": [d.copy() for d in self.devices[DeviceType.SPEAKER]],
-                    "Headphones": [d.copy() for d in self.devices[DeviceType.HEADPHONE]],
+                    "Speakers": list(self.devices[DeviceType.SPEAKER]),
+                    "Headphones": list(self.devices[DeviceType.HEADPHONE]),
                 },
                 "app_device_map": {
-                    app: {
-                        "type": str(config.get("type", "Speakers")),
-                        "device_id": str(config.get("device_id", "")),
-                        "disabled": bool(config.get("disabled", False)),
-                    }
-                    for app, config in self.app_device_map.items()
+                    app: mapping._asdict()
+                    for app, mapping in self.app_device_map.items()
                 },
                 "device_types": {"SPEAKER": "Speakers", "HEADPHONE": "Headphones"},
                 "icon_path": icon_path  # Add icon path to data
             }
 
-            # Launch GUI process
-            self.gui_process = Process(
-                target=run_mapping_gui_process, args=(gui_data, self.gui_queue)
-            )
-            self.gui_process.daemon = True
-            self.gui_process.start()
+            # Launch GUI process once and reuse it for later requests
+            if not (self.gui_process and self.gui_process.is_alive()):
+                if self.gui_conn:
+                    self.gui_conn.close()
+                self.gui_conn, child_conn = Pipe(duplex=False)
+                self.gui_in_queue = Queue()
+                self.gui_process = Process(
+                    target=run_mapping_gui_process,
+                    args=(self.gui_in_queue, child_conn),
+                )
+                self.gui_process.daemon = True
+                self.gui_process.start()
+                # Drop our copy of the send end so a dead child reads as EOF
+                child_conn.close()
+
+            self.gui_in_queue.put(("show", gui_data))
 
             # Start monitoring the queue in main thread
-            self.root.after(100, self._check_gui_queue)
+            if self._gui_poll_after_id:
+                self.root.after_cancel(self._gui_poll_after_id)
+            self._gui_poll_interval = self._gui_poll_min
+            self._gui_poll_after_id = self.root.after(
+                self._gui_poll_interval, self._check_gui_queue
+            )
 
         except Exception as e:
             logging.error(f"Error launching GUI process: {e}", exc_info=True)
 
     def _check_gui_queue(self):
-        """Check GUI queue in main thread"""
+        """Check GUI queue in main thread, backing off while it stays empty"""
+        self._gui_poll_after_id = None
         if not self._active:
             return
 
+        gui_alive = False
+        received = False
         try:
-            while True:
+            # Sample liveness first so messages sent just before exit still drain
+            gui_alive = self.gui_process is not None and self.gui_process.is_alive()
+            conn = self.gui_conn
+            while conn is not None and wait_connections([conn], timeout=0):
                 try:
-                    action, data = self.gui_queue.get_nowait()
-                    logging.debug(f"Received GUI message: {action} with data: {data}")
-
-                    if action == "update_mapping" and isinstance(data, dict):
-                        try:
-                            if self._validate_mapping_data(data):
-                                # Update mappings
-                                self.app_device_map = {}
-                                for app, config in data.items():
-                                    self.app_device_map[app] = {
-                                        "type": str(config["type"]),
-                                        "device_id": str(config["device_id"]),
-                                        "disabled": bool(config.get("disabled", False)),
-                                    }
-
-                                # Save and reload config
-                                if self.save_config():
-                                    if self.reload_config():
-                                        logging.info(
-                                            "Configuration updated and reloaded"
-                                        )
-                                    else:
-                                        logging.error("Failed to reload configuration")
-                                else:
-                                    raise Exception("Failed to save configuration")
-
-                            else:
-                                raise ValueError("Invalid mapping data received")
-
-                        except Exception as e:
-                            logging.error(
-                                f"Error updating mappings: {e}", exc_info=True
-                            )
-                            self.show_notification("Error", "Failed to update mappings")
-
-                    elif action == "force_reload":
-                        self._force_reload_config()
-
-                    elif action == "force_save":
-                        if self.save_config() and self.reload_config():
-                            logging.info("Force save and reload successful")
-                        else:
-                            self.show_notification(
-                                "Error", "Failed to save configuration"
-                            )
-
-                except queue.Empty:
+                    action, data = conn.recv()
+                except EOFError:
                     break
-
-            # Schedule next check if GUI is active
-            if self.gui_process and self.gui_process.is_alive():
-                self.root.after(100, self._check_gui_queue)
+                except OSError as e:
+                    # Broken pipe: drop the GUI process so the next request
+                    # relaunches it with a fresh pipe
+                    logging.warning(f"GUI pipe failed, discarding GUI process: {e}")
+                    self._discard_gui_process()
+                    gui_alive = False
+                    break
+                received = True
+                self._handle_gui_message(action, data)
 
         except Exception as e:
             logging.error(f"Error in GUI queue handler: {e}", exc_info=True)
 
+        finally:
+            # Schedule next check if GUI is active, even after a failed message
+            if gui_alive and self._active:
+                if received:
+                    self._gui_poll_interval = self._gui_poll_min
+                else:
+                    self._gui_poll_interval = min(
+                        self._gui_poll_interval * 2, self._gui_poll_max
+                    )
+                self._gui_poll_after_id = self.root.after(
+                    self._gui_poll_interval, self._check_gui_queue
+                )
+
+    def _discard_gui_process(self):
+        """Close the GUI pipe and stop the GUI process"""
+        if self.gui_conn:
+            self.gui_conn.close()
+            self.gui_conn = None
+        if self.gui_process and self.gui_process.is_alive():
+            self.gui_process.terminate()
+            self.gui_process.join(timeout=1.0)
+        self.gui_process = None
+
+    def _handle_gui_message(self, action, data):
+        """Apply one message received from the GUI process"""
+        logging.debug(f"Received GUI message: {action} with data: {data}")
+
+        if action == "update_mapping" and isinstance(data, dict):
+            try:
+                if self._validate_mapping_data(data):
+                    self._apply_mapping_update(data)
+                else:
+                    raise ValueError("Invalid mapping data received")
+
+            except Exception as e:
+                logging.error(f"Error updating mappings: {e}", exc_info=True)
+                self.show_notification("Error", "Failed to update mappings")
+
+        elif action == "force_reload":
+            self._force_reload_config()
+
+        elif action == "force_save":
+            # Mappings are already applied; this only guarantees a write
+            self._schedule_config_flush()
+
+    def _apply_mapping_update(self, data):
+        """Apply validated GUI mappings in memory and save in the background"""
+        old_map = self.app_device_map
+        self._set_app_device_map(self._parse_app_map(data))
+        if self.app_device_map != old_map:
+            logging.info(
+                f"Updated mappings from GUI: {len(self.app_device_map)} entries"
+            )
+            self._schedule_refresh()
+        self._schedule_config_flush()
+
     def _validate_mapping_data(self, data):
         """Validate mapping data from GUI"""
         try:
@@ -1796,27 +2263,8 @@ class AudioSwitcher:
                 return False
 
             for app, config in data.items():
-                if not isinstance(config, dict):
-                    logging.error(f"Invalid config for app {app}")
-                    return False
-
-                # Check required fields
-                if "type" not in config:
-                    logging.error(f"Missing type in config for app {app}")
-                    return False
-                if "device_id" not in config:
-                    logging.error(f"Missing device_id in config for app {app}")
-                    return False
-
-                # Validate field types
-                if not isinstance(config["type"], str):
-                    logging.error(f"Invalid type format for app {app}")
-                    return False
-                if not isinstance(config["device_id"], (str, int)):
-                    logging.error(f"Invalid device_id format for app {app}")
-                    return False
-                if "disabled" in config and not isinstance(config["disabled"], bool):
-                    logging.error(f"Invalid disabled format for app {app}")
+                if not _is_valid_mapping_entry(config):
+                    logging.error(f"Invalid config for app {app}: {config}")
                     return False
 
             logging.debug(f"Validated mapping data: {data}")
@@ -1855,16 +2303,20 @@ class AudioSwitcher:
             self.show_notification("Error", "Failed to open mapping configuration")
 
     def check_for_updates(self):
-        """Check for available updates"""
+        """Check for available updates without blocking the caller"""
         try:
-            if self.update_checker.check_for_updates():
-                self.show_notification(
-                    "Update Available",
-                    f"Version {self.update_checker.latest_version} is available",
-                )
+            self.update_checker.check_async(self._on_update_checked)
         except Exception as e:
             logging.error(f"Error checking for updates: {e}")
 
+    def _on_update_checked(self, update_available):
+        """Notify about a new version (called from the update check thread)"""
+        if update_available and self._active:
+            self.show_notification(
+                "Update Available",
+                f"Version {self.update_checker.latest_version} is available",
+            )
+
     def _on_root_close(self):
         """Handle root window close"""
         if self._active:
@@ -1881,6 +2333,40 @@ class AudioSwitcher:
         """Deprecated - use _process_menu_events instead"""
         pass
 
+    def _on_config_file_changed(self):
+        """Hand a config write to the Tk thread (called from watcher thread)"""
+        self._config_file_changed = True
+        try:
+            self.root.after(0, self._apply_config_file_change)
+        except (RuntimeError, tk.TclError) as e:
+            # mainloop not running yet; the startup check reads the flag
+            logging.debug(f"Deferring config check: {e}")
+
+    def _apply_config_file_change(self):
+        """Reload config after a watched write; runs on the Tk thread"""
+        if not self._active:
+            return
+        if self._config_file_changed:
+            self._config_file_changed = False
+            self._check_config_changes()
+        # Fall back to stat polling once the watcher is down
+        watcher = self.config_watcher
+        if not (watcher and watcher.running) and self._config_poll_after_id is None:
+            self._config_poll_after_id = self.root.after(
+                self._config_poll_interval, self._poll_config_changes
+            )
+
+    def _poll_config_changes(self):
+        """Stat the config file periodically while the watcher is down"""
+        self._config_poll_after_id = None
+        if not self._active:
+            return
+        self._config_file_changed = False
+        self._check_config_changes()
+        self._config_poll_after_id = self.root.after(
+            self._config_poll_interval, self._poll_config_changes
+        )
+
     def _check_config_changes(self):
         """Check if config file has been modified externally"""
         try:
@@ -1944,23 +2430,16 @@ if __name__ == "__main__":
         app = AudioSwitcher()
         logging.info("Application started")
 
-        # Main event loop
-        while app._active:
-            try:
-                app.root.update()
-                time.sleep(0.01)
-
-                # Check tray thread
-                if not app.tray_thread.is_alive():
-                    break
+        # Check the tray thread periodically instead of spinning the loop
+        def _tray_watchdog():
+            if not app._active or not app.tray_thread.is_alive():
+                app.root.quit()
+            else:
+                app.root.after(500, _tray_watchdog)
 
-            except tk.TclError as e:
-                if "application has been destroyed" not in str(e):
-                    logging.error(f"Main loop error: {e}")
-                break
-            except Exception as e:
-                logging.error(f"Main loop error: {e}")
-                break
+        # Main event loop
+        app.root.after(500, _tray_watchdog)
+        app.root.mainloop()
 
     except Exception as e:
         logging.critical(f"Application error: {e}", exc_info=True)
@@ -1,4 +1,5 @@
 import PyInstaller.__main__
+import json
 import os
 import shutil
 import sys
@@ -61,6 +62,13 @@ def build_app():
             f"--add-data={temp_resources}/*;resources/",
             "--hidden-import=pystray._win32",
             "--hidden-import=PIL._tkinter_finder",
+            # Keep the archive small: every bundled module is a startup cost
+            "--exclude-module=unittest",
+            "--exclude-module=pydoc_data",
+            "--exclude-module=xml.dom",
+            "--exclude-module=distutils",
+            "--optimize=2",
+            "--noupx",
             "--clean",
             "--noconfirm",
             "--uac-admin",
@@ -84,10 +92,18 @@ def build_app():
     # Create config file
     config_path = os.path.join(dist_dir, "config.json")
     if not os.path.exists(config_path):
+        default_config = {
+            "speakers": [],
+            "headphones": [],
+            "hotkeys": {"switch_device": "ctrl+alt+s", "switch_type": "ctrl+alt+t"},
+            "kernel_mode_enabled": True,
+            "force_start": False,
+            "debug_mode": False,
+            "auto_switch_enabled": True,
+            "app_device_map": {},
+        }
         with open(config_path, "w") as f:
-            f.write(
-                '{"speakers":[],"headphones":[],"hotkeys":{"switch_device":"ctrl+alt+s","switch_type":"ctrl+alt+t"}, "kernel_mode_enabled": true, "force_start": false,"debug_mode":false,"auto_switch_enabled": true, "app_device_map": "{}"}'
-            )
+            f.write(json.dumps(default_config, indent=4))
 
     # Clean up temp directory
     shutil.rmtree(temp_resources)
@@ -1,18 +1,52 @@
 import logging
 import tkinter as tk
 from tkinter import ttk
-import threading
 import time
-import queue
+from collections import deque
 
 
 class OverlayNotification:
+    # Title keywords and the icon shown for them, checked in order
+    _ICON_TABLE = (("speaker", "🔊"), ("headphone", "🎧"))
+    _DEFAULT_ICON = "🔔"
+
+    # (alpha, downward offset in px) per animation frame, from hidden to shown
+    _FRAMES = tuple((i / 5, 15 * (5 - i) // 5) for i in range(6))
+
     def __init__(self):
-        self.notification_queue = queue.Queue()
-        self.is_showing = False
-        self.lock = threading.Lock()
+        # Single consumer (the Tk thread); deque appends and pops are atomic,
+        # and a full buffer drops the oldest notification
+        self.notification_queue = deque(maxlen=16)
+        # Window currently being shown, or None while idle
+        self._active_window = None
+
+        # Notifications drained from the queue but not yet shown
+        self._pending = []
+        self._max_pending_age = 10.0  # seconds
+        # Same-title notifications closer together than this collapse into one
+        self._coalesce_window = 0.15  # seconds
         self._active = True
-        self._setup_done = threading.Event()
+        # Set once _init_root finishes; all other state belongs to the Tk thread
+        self._ready = False
+
+        # The owner wakes the queue handler through a Tk loop that runs
+        # mainloop(); this interpreter never does, so cross-thread calls into
+        # it stall and fail. The poll is only a safety net for missed wakeups
+        self._poll_interval = 1000  # milliseconds
+        self._poll_after_id = None
+
+        # Notification window and labels, built once in _init_root
+        self._notif_window = None
+        self._notif_icon_lbl = None
+        self._notif_title_lbl = None
+        self._notif_msg_lbl = None
+
+        # Screen size and per-text window sizes, so showing a repeated
+        # notification needs no layout pass
+        self._screen_w = 0
+        self._screen_h = 0
+        self._size_cache = {}
+        self._size_cache_limit = 32
 
         # Initialize Tkinter in the main thread
         self.root = None
@@ -25,6 +59,8 @@ class OverlayNotification:
             self.root.withdraw()
             self.root.protocol("WM_DELETE_WINDOW", self.destroy)
             self.root.wm_attributes("-topmost", True)
+            self._screen_w = self.root.winfo_screenwidth()
+            self._screen_h = self.root.winfo_screenheight()
 
             # Updated modern styles with new color scheme
             style = ttk.Style(self.root)
@@ -48,28 +84,75 @@ class OverlayNotification:
                 borderwidth=0,
             )
 
+            # Build the reusable window up front so the first notification
+            # doesn't pay for widget creation
+            self._build_window()
+
             logging.debug("Notification system initialized")
 
             # Create message queue handler
-            self.root.after(100, self._check_queue)
-            self._setup_done.set()
+            self._poll_after_id = self.root.after(
+                self._poll_interval, self._check_queue
+            )
+            self._ready = True
 
         except Exception as e:
             logging.error(f"Failed to initialize notification window: {e}")
             self._active = False
-            self._setup_done.set()
             raise
 
     def _check_queue(self):
-        """Check message queue periodically"""
+        """Show the next pending notification if the window is free"""
+        self._poll_after_id = None
         if self._active and self.root and self.root.winfo_exists():
-            if not self.is_showing:
-                try:
-                    title, message, duration = self.notification_queue.get_nowait()
+            self._drain_queue()
+            delay = self._poll_interval
+            if self._active_window is None and self._pending:
+                # Hold a fresh notification briefly so rapid repeats coalesce
+                wait = self._pending[0][3] + self._coalesce_window - time.monotonic()
+                if wait > 0:
+                    delay = int(wait * 1000) + 1
+                else:
+                    title, message, duration, _queued_at = self._pending.pop(0)
                     self._show_notification(title, message, duration)
-                except queue.Empty:
-                    pass
-            self.root.after(100, self._check_queue)
+
+            self._poll_after_id = self.root.after(delay, self._check_queue)
+
+    def _drain_queue(self):
+        """Move all queued notifications to the pending list in one pass"""
+        try:
+            while True:
+                self._pending.append(self.notification_queue.popleft())
+        except IndexError:
+            pass
+
+        if not self._pending:
+            return
+
+        # Keep only the latest copy of each notification, let a same-title
+        # notification replace one queued just before it, and drop stale ones
+        cutoff = time.monotonic() - self._max_pending_age
+        latest = {}
+        latest_by_title = {}
+        for item in self._pending:
+            if item[3] < cutoff:
+                continue
+            latest.pop(item[:2], None)
+            previous = latest_by_title.get(item[0])
+            if previous is not None and item[3] - previous[3] < self._coalesce_window:
+                latest.pop(previous[:2], None)
+            latest[item[:2]] = item
+            latest_by_title[item[0]] = item
+        # Same bound as the buffer, so a stalled consumer can't pile up work
+        self._pending = list(latest.values())[-self.notification_queue.maxlen :]
+
+    def process_queue(self):
+        """Check the queue immediately; call on the thread that created this"""
+        if not self._active or not self.root:
+            return
+        if self._poll_after_id:
+            self.root.after_cancel(self._poll_after_id)
+        self._check_queue()
 
     def show_notification(self, title, message, duration=2.0):
         """Queue notification for display"""
@@ -77,173 +160,185 @@ class OverlayNotification:
             return
 
         try:
-            self.notification_queue.put((title, message, duration))
+            if len(self.notification_queue) == self.notification_queue.maxlen:
+                logging.debug("Notification buffer full, dropping oldest")
+            self.notification_queue.append((title, message, duration, time.monotonic()))
         except Exception as e:
             logging.error(f"Error queueing notification: {e}")
+            return
+
+    def _build_window(self):
+        """Create the notification window once; it is reused for every message"""
+        window = tk.Toplevel(self.root)
+        window.withdraw()
+        window.overrideredirect(True)
+        window.attributes("-topmost", True)
+
+        # Enhanced shadow and border effect
+        window.configure(bg="#1A1A1A")
+        window.attributes("-transparentcolor", "#1A1A1A")
+
+        # Create rounded frame with border
+        content_frame = tk.Frame(
+            window,
+            bg="#2B2B2B",
+            highlightbackground="#3B3B3B",
+            highlightthickness=1,
+        )
+        content_frame.pack(padx=3, pady=3)
+
+        # Create inner frame with additional styling
+        inner_frame = tk.Frame(
+            content_frame,
+            bg="#2B2B2B",
+            padx=2,
+            pady=2,
+        )
+        inner_frame.pack(fill="both", expand=True)
+
+        # Main content frame with rounded corners
+        frame = ttk.Frame(inner_frame, style="Custom.TFrame", padding=(12, 8, 12, 8))
+        frame.pack(expand=True, fill="both")
+
+        # Plain container for the icon and text; it takes its size from them
+        body = tk.Frame(frame, bg="#2B2B2B")
+        body.pack(expand=True, fill="both")
+
+        self._notif_icon_lbl = tk.Label(
+            body,
+            font=("Segoe UI", 13),
+            bg="#2B2B2B",
+            fg="#FFFFFF",
+        )
+        self._notif_icon_lbl.pack(side="left", padx=(8, 8))
+
+        # Text container
+        text_frame = tk.Frame(body, bg="#2B2B2B")
+        text_frame.pack(side="left", fill="both", expand=True)
+
+        # Title label
+        self._notif_title_lbl = tk.Label(
+            text_frame,
+            font=("Segoe UI Semibold", 11),
+            bg="#2B2B2B",
+            fg="#FFFFFF",
+        )
+        self._notif_title_lbl.pack(anchor="w", pady=(0, 1))
+
+        # Message label
+        self._notif_msg_lbl = tk.Label(
+            text_frame,
+            font=("Segoe UI", 10),
+            bg="#2B2B2B",
+            fg="#E8E8E8",
+            wraplength=250,
+        )
+        self._notif_msg_lbl.pack(anchor="w")
+
+        def on_close():
+            try:
+                if window.winfo_exists():
+                    window.withdraw()
+            except:
+                pass
+            finally:
+                self._active_window = None
+
+        # Ensure cleanup happens even if window is closed
+        window.protocol("WM_DELETE_WINDOW", on_close)
+        self._notif_window = window
 
     def _show_notification(self, title, message, duration):
         """Show actual notification window"""
         try:
-            self.is_showing = True
-
-            window = tk.Toplevel(self.root)
-            window.overrideredirect(True)
-            window.attributes("-topmost", True)
-
-            # Enhanced shadow and border effect
-            window.configure(bg="#1A1A1A")
-            window.attributes("-transparentcolor", "#1A1A1A")
-
-            # Create rounded frame with border
-            content_frame = tk.Frame(
-                window,
-                bg="#2B2B2B",
-                highlightbackground="#3B3B3B",
-                highlightthickness=1,
-            )
-            content_frame.pack(padx=3, pady=3)
-
-            # Create inner frame with additional styling
-            inner_frame = tk.Frame(
-                content_frame,
-                bg="#2B2B2B",
-                padx=2,
-                pady=2,
+            if self._notif_window is None or not self._notif_window.winfo_exists():
+                self._build_window()
+            window = self._notif_window
+            self._active_window = window
+
+            folded = title.casefold()
+            icon_text = next(
+                (icon for key, icon in self._ICON_TABLE if key in folded),
+                self._DEFAULT_ICON,
             )
-            inner_frame.pack(fill="both", expand=True)
-
-            # Main content frame with rounded corners
-            frame = ttk.Frame(
-                inner_frame, style="Custom.TFrame", padding=(12, 8, 12, 8)
-            )
-            frame.pack(expand=True, fill="both")
-
-            def create_rounded_frame(parent, bg_color="#2B2B2B", corner_radius=10):
-                canvas = tk.Canvas(
-                    parent,
-                    bg=bg_color,
-                    highlightthickness=0,
-                    width=400,
-                    height=200,
-                )
-                canvas.pack(expand=True, fill="both")
-
-                # Create rounded rectangle
-                canvas.create_rectangle(
-                    corner_radius,
-                    corner_radius,
-                    canvas.winfo_reqwidth() - corner_radius,
-                    canvas.winfo_reqheight() - corner_radius,
-                    fill=bg_color,
-                    outline=bg_color,
-                )
-                return canvas
-
-            rounded_canvas = create_rounded_frame(frame)
-
-            # Rest of the content (icon and text) now goes on the canvas
-            icon_text = "🔊" if "speaker" in title.lower() else "🎧"
-            icon_label = tk.Label(
-                rounded_canvas,
-                text=icon_text,
-                font=("Segoe UI", 13),
-                bg="#2B2B2B",
-                fg="#FFFFFF",
-            )
-            icon_label.pack(side="left", padx=(8, 8))
-
-            # Text container
-            text_frame = tk.Frame(rounded_canvas, bg="#2B2B2B")
-            text_frame.pack(side="left", fill="both", expand=True)
-
-            # Title label
-            title_label = tk.Label(
-                text_frame,
-                text=title,
-                font=("Segoe UI Semibold", 11),
-                bg="#2B2B2B",
-                fg="#FFFFFF",
-            )
-            title_label.pack(anchor="w", pady=(0, 1))
-
-            # Message label
-            msg_label = tk.Label(
-                text_frame,
-                text=message,
-                font=("Segoe UI", 10),
-                bg="#2B2B2B",
-                fg="#E8E8E8",
-                wraplength=250,
-            )
-            msg_label.pack(anchor="w")
-
-            window.update_idletasks()
-            width = window.winfo_width() + 16
-            height = window.winfo_height() + 8
-            screen_width = window.winfo_screenwidth()
-            screen_height = window.winfo_screenheight()
-            x = (screen_width - width) // 2
-            y = screen_height - height - 50
+            self._notif_icon_lbl.configure(text=icon_text)
+            self._notif_title_lbl.configure(text=title)
+            self._notif_msg_lbl.configure(text=message)
+
+            # The window is withdrawn, so size it from the requested geometry;
+            # the size only depends on the text
+            size = self._size_cache.get((title, message))
+            if size is None:
+                window.update_idletasks()
+                size = (window.winfo_reqwidth() + 16, window.winfo_reqheight() + 8)
+                if len(self._size_cache) >= self._size_cache_limit:
+                    self._size_cache.clear()
+                self._size_cache[(title, message)] = size
+            width, height = size
+            x = (self._screen_w - width) // 2
+            y = self._screen_h - height - 50
 
             window.attributes("-alpha", 0)
-            original_y = y
-            slide_distance = 15
-
-            for i in range(6):
-                current_y = int(original_y + (slide_distance * (5 - i) / 5))
-                window.geometry(f"+{x}+{current_y}")
-                window.attributes("-alpha", i / 5)
-                window.update()
-                time.sleep(0.01)
-
-            # Force full opacity at end
-            window.attributes("-alpha", 1)
-            window.geometry(f"+{x}+{original_y}")
-
-            # Schedule fade out
-            def fade_out():
+            frames = self._FRAMES
+            steps = len(frames) - 1
+            frame_interval = 16  # milliseconds
+            fade_in_time = 0.05  # seconds
+            fade_out_time = 0.1  # seconds
+
+            def show_frame(i):
+                alpha, offset = frames[i]
+                window.geometry(f"+{x}+{y + offset}")
+                window.attributes("-alpha", alpha)
+
+            def frame_at(start, span):
+                """Frame reached after the elapsed part of span, in wall time"""
+                elapsed = time.perf_counter() - start
+                return min(steps, int(elapsed / span * steps))
+
+            # Animate via after() so the event loop keeps running between frames;
+            # frames follow elapsed time, so coarse timer ticks don't stretch it
+            def fade_in(start=None):
                 try:
-                    # Faster fade out
-                    for i in range(5, -1, -1):
-                        if window.winfo_exists():
-                            window.attributes("-alpha", i / 5)
-                            current_y = int(original_y + (slide_distance * (5 - i) / 5))
-                            window.geometry(f"+{x}+{current_y}")
-                            window.update()
-                            time.sleep(0.02)
-                    if window.winfo_exists():
-                        window.destroy()
+                    if not window.winfo_exists():
+                        self._active_window = None
+                        return
+                    if start is None:
+                        start = time.perf_counter()
+                        show_frame(0)
+                        window.deiconify()
+                    i = frame_at(start, fade_in_time)
+                    show_frame(i)
+                    if i < steps:
+                        window.after(frame_interval, fade_in, start)
+                    else:
+                        window.after(int(duration * 1000), fade_out)
                 except Exception as e:
-                    logging.error(f"Error in fade out: {e}")
-                finally:
-                    self.is_showing = False
+                    logging.error(f"Error in fade in: {e}")
+                    self._active_window = None
 
-            window.after(int(duration * 1000), fade_out)
-
-            def on_close():
+            def fade_out(start=None):
                 try:
+                    if start is None:
+                        start = time.perf_counter()
                     if window.winfo_exists():
-                        window.destroy()
-                except:
-                    pass
-                finally:
-                    self.is_showing = False
+                        i = frame_at(start, fade_out_time)
+                        if i < steps:
+                            show_frame(steps - i)
+                            window.after(frame_interval, fade_out, start)
+                            return
+                        window.withdraw()
+                    self._active_window = None
+                    # Show the next one without waiting for the poll
+                    self.process_queue()
+                except Exception as e:
+                    logging.error(f"Error in fade out: {e}")
+                    self._active_window = None
 
-            # Ensure cleanup happens even if window is closed
-            window.protocol("WM_DELETE_WINDOW", on_close)
+            fade_in()
 
         except Exception as e:
             logging.error(f"Error showing notification: {e}")
-            self.is_showing = False
-
-    def process_events(self):
-        """Process Tkinter events in main thread"""
-        if self._active and self.root and self.root.winfo_exists():
-            try:
-                self.root.update()
-            except Exception as e:
-                if self._active:  # Only log if not shutting down
-                    logging.error(f"Error updating root window: {e}")
+            self._active_window = None
 
     def destroy(self):
         """Clean up resources"""
@@ -1,32 +1,157 @@
 import requests
 import logging
+import json
+import os
+import time
+from threading import Lock, Thread
 from packaging import version
+import re
 import webbrowser
 
+# tag_name is a top-level string field and appears near the start of the body
+TAG_NAME_RE = re.compile(rb'"tag_name"\s*:\s*"([^"]+)"')
+# Tags packaging can parse, checked up front instead of catching InvalidVersion
+VERSION_TAG_RE = re.compile(
+    r"^\s*" + version.VERSION_PATTERN + r"\s*$", re.VERBOSE | re.IGNORECASE
+)
+
 class UpdateChecker:
     def __init__(self, current_version):
         self.current_version = current_version
         self.github_repo = "catalizcs/audio-switcher"
         self.latest_version = None
         self.download_url = None
+        self._current_parsed = version.Version(current_version)
+        self._latest_tag = None
+        self.cache_file = os.path.join(
+            os.getenv("APPDATA", os.getcwd()), "AudioSwitcher", "update_cache.json"
+        )
+        self._cache = self._load_cache()
+        # Serializes checks: the session and cache are not thread-safe
+        self._check_lock = Lock()
+        # One session keeps the connection alive across checks
+        self._session = requests.Session()
+        self._session.headers.update(
+            {"User-Agent": "audio-switcher", "Accept": "application/vnd.github+json"}
+        )
+
+    def _load_cache(self):
+        """Load cached release info and ETag from disk"""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.warning(f"Failed to load update cache: {e}")
+            return {}
+
+    def _save_cache(self):
+        """Persist cached release info and ETag"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+        except Exception as e:
+            logging.warning(f"Failed to save update cache: {e}")
+
+    def _apply_release(self, tag, url):
+        """Record release info and compare it with the running version"""
+        if not tag:
+            return False
+        # Only parse when the tag changed since the last check
+        if tag != self._latest_tag:
+            if not VERSION_TAG_RE.match(tag):
+                logging.info(f"Ignoring release with non-version tag: {tag}")
+                return False
+            self.latest_version = version.Version(tag.lstrip("v"))
+            self._latest_tag = tag
+        self.download_url = url
+        return self._current_parsed < self.latest_version
+
+    @staticmethod
+    def _read_tag_name(response):
+        """Search the body only until tag_name appears, skipping release notes"""
+        tag = None
+        buffer = b""
+        # Read to the end even after a match: a streamed response closed
+        # early drops its connection instead of returning it to the pool
+        for chunk in response.iter_content(chunk_size=4096):
+            if tag is None:
+                buffer += chunk
+                match = TAG_NAME_RE.search(buffer)
+                if match:
+                    tag = match.group(1).decode("utf-8")
+                    buffer = b""
+        return tag
 
     def check_for_updates(self):
         """Check GitHub for latest release version"""
+        with self._check_lock:
+            return self._check_for_updates()
+
+    def _check_for_updates(self):
+        """Run one update check; caller holds _check_lock"""
         try:
-            response = requests.get(
+            # Don't spend a request while the rate limit is exhausted
+            if time.time() < self._cache.get("rate_limit_reset", 0):
+                logging.info("Skipping update check until rate limit resets")
+                return self._apply_release(self._cache.get("tag"), self._cache.get("url"))
+
+            headers = {}
+            if self._cache.get("etag"):
+                headers["If-None-Match"] = self._cache["etag"]
+
+            with self._session.get(
                 f"https://api.github.com/repos/{self.github_repo}/releases/latest",
-                timeout=5
-            )
-            if response.status_code == 200:
-                data = response.json()
-                self.latest_version = version.parse(data["tag_name"].lstrip("v"))
-                self.download_url = data["html_url"]
-                return version.parse(self.current_version) < self.latest_version
+                headers=headers,
+                timeout=5,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    # Consume the short body so the connection can be reused
+                    response.content
+                if response.status_code == 304:
+                    # Release unchanged; GitHub sent headers only
+                    return self._apply_release(
+                        self._cache.get("tag"), self._cache.get("url")
+                    )
+                if response.status_code == 200:
+                    tag = self._read_tag_name(response)
+                    if not tag:
+                        logging.error("Release response has no tag_name")
+                        return False
+                    url = f"https://github.com/{self.github_repo}/releases/tag/{tag}"
+                    self._cache = {
+                        "etag": response.headers.get("ETag"),
+                        "tag": tag,
+                        "url": url,
+                        "ts": time.time(),
+                    }
+                    self._save_cache()
+                    return self._apply_release(tag, url)
+                if response.headers.get("X-RateLimit-Remaining") == "0":
+                    self._cache["rate_limit_reset"] = int(
+                        response.headers.get("X-RateLimit-Reset", 0)
+                    )
+                    self._save_cache()
+                    logging.warning("GitHub rate limit reached for update checks")
             return False
         except Exception as e:
             logging.error(f"Failed to check for updates: {e}")
             return False
 
+    def check_async(self, on_done):
+        """Check for updates on a background thread and pass the result to on_done"""
+        if self._check_lock.locked():
+            logging.info("Update check already in progress")
+            return
+        Thread(
+            target=lambda: on_done(self.check_for_updates()),
+            daemon=True,
+            name="UpdateCheck",
+        ).start()
+
     def open_download_page(self):
         """Open download page in browser"""
         if self.download_url: